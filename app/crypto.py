@@ -29,6 +29,19 @@ def decrypt(key: bytes, blob: bytes, aad: bytes | None = None) -> bytes:
     aes = AESGCM(key)
     return aes.decrypt(nonce, ct, aad)
 
+def decrypt_many(key: bytes, items):
+    """items: [(id, blob, aad), ...] → (id, 평문 또는 None)을 차례로. 같은 키로 여러 건 복호화할 때 사용"""
+    aes = AESGCM(key)
+    for item_id, blob, aad in items:
+        try:
+            yield item_id, aes.decrypt(blob[:NONCE_LEN], blob[NONCE_LEN:], aad)
+        except Exception:
+            yield item_id, None
+
+def find_invalid(key: bytes, items) -> list:
+    """items: [(id, blob, aad), ...] 중 인증(복호)에 실패한 id 목록. 워커 스레드에서 호출"""
+    return [item_id for item_id, pt in decrypt_many(key, items) if pt is None]
+
 def make_verifier(key: bytes) -> bytes:
     # 헤더 검증용: 고정 문자열을 AEAD로 암호화해 저장, 해제 시 복호 성공 여부로 키 검증
     return encrypt(key, b"vault-ok")
@@ -0,0 +1,94 @@
+# app/domains.py
+# URL → 등록 도메인(eTLD+1) 변환. 공개 접미사 목록을 처음 쓸 때 트라이로 읽어 둔다.
+#   mail.google.com → google.com, a.b.example.co.kr → example.co.kr, user.github.io → user.github.io
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, Union
+from urllib.parse import urlsplit
+
+from app.utils import resource_path
+
+PSL_PATH = Path(resource_path("app/data/public_suffix.dat"))
+
+# 트라이 노드: {라벨: 자식}. 자식이 True면 자식 없는 규칙 끝,
+# dict면 하위 노드이고 "" 키가 있으면 그 자체도 규칙 끝. "*"는 와일드카드, "!라벨"은 예외 규칙
+Node = Dict[str, Union[bool, "Node"]]
+_trie: Optional[Node] = None
+
+def _load_trie() -> Node:
+    root: Node = {}
+    for line in PSL_PATH.read_text(encoding="utf-8").splitlines():
+        if not line or line.startswith("//"):
+            continue
+        exception = line.startswith("!")
+        labels = line.lstrip("!").split(".")[::-1]
+        last = ("!" if exception else "") + labels.pop()
+        node = root
+        for label in labels:
+            child = node.get(label)
+            if child is None or child is True:
+                child = node[label] = {"": True} if child else {}
+            node = child
+        if isinstance(node.get(last), dict):
+            node[last][""] = True
+        else:
+            node[last] = True
+    return root
+
+def _get_trie() -> Node:
+    global _trie
+    if _trie is None:
+        _trie = _load_trie()
+    return _trie
+
+def url_host(url: str) -> str:
+    """URL(스킴 생략 가능)에서 소문자 호스트명만 추출. 실패하면 빈 문자열"""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if "://" not in url:
+        url = "http://" + url
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
+    host = host.rstrip(".")
+    if " " in host:
+        return ""
+    if "xn--" in host:
+        try:
+            host = host.encode("ascii").decode("idna")
+        except UnicodeError:
+            pass
+    return host
+
+@lru_cache(maxsize=4096)
+def registrable_domain(host: str) -> str:
+    """호스트의 등록 도메인(공개 접미사 + 한 라벨). IP나 접미사 자체면 호스트 그대로"""
+    if not host or ":" in host or host.replace(".", "").isdigit():
+        return host
+    labels = host.split(".")
+    node = _get_trie()
+    n = 1                                   # 목록에 없으면 마지막 라벨이 접미사("*" 기본 규칙)
+    for k, label in enumerate(reversed(labels), 1):
+        if "!" + label in node:
+            n = k - 1
+            break
+        if "*" in node:
+            n = k
+        child = node.get(label)
+        if child is None:
+            break
+        if child is True:
+            n = k
+            break
+        if "" in child:
+            n = k
+        node = child
+    if n >= len(labels):
+        return host
+    return ".".join(labels[-(n + 1):])
+
+def url_domain(url: str) -> str:
+    """URL → 등록 도메인 (색인 키)"""
+    return registrable_domain(url_host(url))
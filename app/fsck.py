@@ -0,0 +1,122 @@
+# app/fsck.py
+# 사용: python -m app.fsck [--db PATH] [--resume] [--quarantine]
+#       python -m app.fsck [--db PATH] --list-quarantine | --restore ID | --purge ID
+import argparse, getpass, multiprocessing, sqlite3, sys
+from pathlib import Path
+
+from app.store import (Vault, VERIFY_WORKERS, verify_pool, verify_state_path, new_verify_state,
+                       load_verify_state, save_verify_state, merge_verify_report)
+from app.utils import get_db_path
+
+def checkpoint_path(db_path: Path) -> Path:
+    return verify_state_path(db_path, "fsck")
+
+def print_quarantine(vault: Vault) -> int:
+    rows = vault.list_quarantined()
+    print(f"격리 항목 {len(rows)}건")
+    for r in rows:
+        print(f"  id={r['id']}  {r['display']}  ({r['reason']}, {r['quarantined_at']})")
+    return 0
+
+def restore(vault: Vault, entry_id: int) -> int:
+    try:
+        ok = vault.restore_quarantined(entry_id)
+    except KeyError:
+        print(f"격리 항목 id={entry_id}가 없습니다.", file=sys.stderr)
+        return 2
+    except sqlite3.IntegrityError:
+        print(f"id={entry_id} 항목이 이미 목록에 있어 되돌릴 수 없습니다.", file=sys.stderr)
+        return 2
+    if not ok:
+        print(f"id={entry_id}를 되돌렸지만 여전히 복호화할 수 없습니다(다음 검사에서 다시 격리 대상).")
+        return 1
+    print(f"id={entry_id}를 되돌렸습니다.")
+    return 0
+
+def purge(vault: Vault, entry_id: int) -> int:
+    try:
+        vault.purge_quarantined(entry_id)
+    except KeyError:
+        print(f"격리 항목 id={entry_id}가 없습니다.", file=sys.stderr)
+        return 2
+    print(f"격리 항목 id={entry_id}를 삭제했습니다.")
+    return 0
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="fsck", description="금고 무결성 검사")
+    ap.add_argument("--db", type=Path, default=None, help="vault.db 경로 (기본: 앱 데이터 폴더)")
+    ap.add_argument("--resume", action="store_true", help="이전 체크포인트에서 이어서 검사")
+    ap.add_argument("--quarantine", action="store_true", help="깨진 항목을 quarantine 테이블로 격리")
+    ap.add_argument("--workers", type=int, default=VERIFY_WORKERS, help="인증 워커 프로세스 수")
+    cmd = ap.add_mutually_exclusive_group()
+    cmd.add_argument("--list-quarantine", action="store_true", help="격리된 항목 목록 출력 (비밀번호 불필요)")
+    cmd.add_argument("--restore", type=int, metavar="ID", help="격리된 항목을 목록으로 되돌림")
+    cmd.add_argument("--purge", type=int, metavar="ID", help="격리된 항목을 완전히 삭제(복구 불가)")
+    args = ap.parse_args(argv)
+
+    db_path = args.db or get_db_path()
+    vault = Vault(db_path)
+    try:
+        vault.connect()
+        if not vault.is_initialized():
+            print("초기화되지 않은 금고입니다.", file=sys.stderr)
+            return 2
+        vault.init_db_if_needed()
+        if args.list_quarantine:
+            return print_quarantine(vault)
+        ok = vault.unlock(getpass.getpass("마스터 비밀번호: "))
+        if ok and (args.restore is not None or args.purge is not None):
+            rc = restore(vault, args.restore) if args.restore is not None else purge(vault, args.purge)
+            vault.lock()
+            return rc
+    except sqlite3.DatabaseError as e:
+        print(f"DB를 열 수 없습니다(손상 가능): {e}", file=sys.stderr)
+        return 2
+    if not ok:
+        print("잠금 해제 실패(비밀번호 불일치).", file=sys.stderr)
+        return 2
+
+    ckpt = checkpoint_path(db_path)
+    state = load_verify_state(ckpt) if args.resume else new_verify_state()
+    if state["last_id"]:
+        print(f"id {state['last_id']} 이후부터 재개")
+
+    checked, db_error = 0, None
+    pool = verify_pool(args.workers)
+    try:
+        while True:
+            try:
+                rep = vault.verify(start_after=state["last_id"], limit=100_000, workers=args.workers, pool=pool)
+            except sqlite3.DatabaseError as e:
+                db_error = str(e)
+                break
+            checked += rep["checked"]
+            merge_verify_report(state, rep)
+            save_verify_state(ckpt, state)
+            if rep["done"]:
+                break
+    finally:
+        if pool:
+            pool.shutdown()
+
+    integrity_ok = state["integrity"] in (None, ["ok"])
+    if not integrity_ok:
+        print("integrity_check:")
+        for line in state["integrity"]:
+            print(f"  {line}")
+    if db_error:
+        print(f"검사 중 DB 오류(id {state['last_id']} 이후 중단): {db_error}")
+    print(f"검사 {checked}건, 손상 {len(state['broken'])}건")
+    for b in state["broken"]:
+        print(f"  id={b['id']}  {b['display']}")
+    if state["broken"] and args.quarantine and not db_error:
+        vault.quarantine_entries([b["id"] for b in state["broken"]])
+        print("손상 항목을 격리했습니다. 목록: --list-quarantine, 되돌리기: --restore ID, 삭제: --purge ID")
+    if not db_error:
+        ckpt.unlink(missing_ok=True)
+    vault.lock()
+    return 1 if (state["broken"] or not integrity_ok or db_error) else 0
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
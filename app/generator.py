@@ -2,6 +2,9 @@
 import secrets
 import string
 from dataclasses import dataclass
+from typing import Tuple
+
+from app.strength import estimate, Strength
 
 AMBIG = set("O0oIl1|")
 
@@ -40,3 +43,8 @@ def generate(opts: GenOptions) -> str:
     pw_list = req + remain
     secrets.SystemRandom().shuffle(pw_list)
     return "".join(pw_list)
+
+def generate_scored(opts: GenOptions) -> Tuple[str, Strength]:
+    """생성한 비밀번호와 그 강도 추정 결과"""
+    pw = generate(opts)
+    return pw, estimate(pw)
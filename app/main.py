@@ -1,3 +1,4 @@
+import multiprocessing
 import tkinter as tk
 from pathlib import Path
 
@@ -33,4 +34,5 @@ def run():
     root.mainloop()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()   # PyInstaller exe에서 무결성 검사 워커 프로세스 실행용
     run()
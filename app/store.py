@@ -1,9 +1,12 @@
 # app/store.py
-import json, sqlite3, time
+import json, os, sqlite3, time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Callable, Optional, List, Dict, Any, Set, Tuple
 
-from app.crypto import gen_salt, derive_key, make_verifier, check_verifier, encrypt, decrypt
+from app.crypto import gen_salt, derive_key, make_verifier, check_verifier, encrypt, decrypt, decrypt_many, find_invalid
+from app.domains import url_domain
 
 SCHEMA = """
 PRAGMA journal_mode=WAL;
@@ -22,17 +25,73 @@ CREATE TABLE IF NOT EXISTS entries (
   updated_at TEXT NOT NULL
 );
 CREATE INDEX IF NOT EXISTS idx_entries_display ON entries(display);
+CREATE TABLE IF NOT EXISTS quarantine (
+  id INTEGER PRIMARY KEY,   -- 원래 entries.id
+  display TEXT NOT NULL,
+  data   BLOB NOT NULL,
+  created_at TEXT NOT NULL,
+  updated_at TEXT NOT NULL,
+  reason TEXT NOT NULL,
+  quarantined_at TEXT NOT NULL
+);
 """
 
+VERIFY_BATCH = 20_000       # verify()가 한 번에 읽어오는 행 수
+VERIFY_CHUNK = 1_000        # 워커 프로세스 하나가 한 번에 맡는 행 수
+VERIFY_WORKERS = min(8, os.cpu_count() or 1)   # AESGCM.decrypt는 GIL을 거의 놓지 않아 스레드가 아닌 프로세스로 나눔
+URL_QUERY_CHUNK = 500       # match_url의 IN (...) 한 번에 넣는 id 수
+
+def verify_state_path(db_path: Path, tag: str) -> Path:
+    """검사 체크포인트 파일 경로 (<db>.<tag>.json). fsck와 앱 백그라운드 검사는 tag를 달리 씀"""
+    return db_path.with_name(f"{db_path.name}.{tag}.json")
+
+def new_verify_state() -> Dict[str, Any]:
+    return {"last_id": 0, "broken": [], "integrity": None}
+
+def load_verify_state(path: Path) -> Dict[str, Any]:
+    """체크포인트 읽기. 없거나 깨졌으면 처음부터"""
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return new_verify_state()
+    return {**new_verify_state(), **state}
+
+def save_verify_state(path: Path, state: Dict[str, Any]):
+    # 쓰는 도중 종료돼도 이전 체크포인트가 남도록 임시 파일에 쓴 뒤 교체
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+def merge_verify_report(state: Dict[str, Any], report: Dict[str, Any]):
+    """verify() 한 번의 결과를 체크포인트 상태에 반영 (재개 시 겹쳐 검사한 행은 중복 제외)"""
+    if report["integrity"] is not None:
+        state["integrity"] = report["integrity"]
+    seen = {b["id"] for b in state["broken"]}
+    state["broken"].extend(b for b in report["broken"] if b["id"] not in seen)
+    state["last_id"] = report["last_id"]
+
+def verify_pool(workers: Optional[int] = None) -> Optional[ProcessPoolExecutor]:
+    """Vault.verify()를 여러 번 부를 때 재사용할 워커 프로세스 풀. 워커가 1개면 None(현재 프로세스에서 검사)"""
+    n = workers or VERIFY_WORKERS
+    return ProcessPoolExecutor(max_workers=n) if n > 1 else None
+
 class Vault:
     def __init__(self, db_path: Path):
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
         self.key: Optional[bytes] = None
-        
+        # URL 색인 (잠금 해제 후 작업 스레드가 만들어 install_url_index로 넣음, 잠금 시 제거):
+        # 등록 도메인 → id들, id → 등록 도메인. 색인이 없는 동안의 추가/수정/삭제는 _url_pending에 모았다가 재생
+        self._url_index: Optional[Dict[str, Set[int]]] = None
+        self._url_of: Dict[int, str] = {}
+        self._url_pending: List[Tuple[int, Optional[str]]] = []
+
     def lock(self):
-        """메모리 내 키 제거"""
+        """메모리 내 키와 URL 색인 제거"""
         self.key = None
+        self._url_index = None
+        self._url_of = {}
+        self._url_pending = []
 
     def connect(self):
         self.conn = sqlite3.connect(self.db_path, detect_types=0, check_same_thread=False)
@@ -84,6 +143,78 @@ class Vault:
             self.key = key
         return ok
 
+    # ---- URL 색인 ----
+    @staticmethod
+    def _add_url(index: Dict[str, Set[int]], url_of: Dict[int, str], entry_id: int, url: str):
+        domain = url_domain(url)
+        if domain:
+            index.setdefault(domain, set()).add(entry_id)
+            url_of[entry_id] = domain
+
+    def _index_url(self, entry_id: int, url: str):
+        if self._url_index is None:
+            self._url_pending.append((entry_id, url))
+            return
+        self._add_url(self._url_index, self._url_of, entry_id, url)
+
+    def _unindex_url(self, entry_id: int):
+        if self._url_index is None:
+            self._url_pending.append((entry_id, None))
+            return
+        domain = self._url_of.pop(entry_id, None)
+        if domain:
+            ids = self._url_index[domain]
+            ids.discard(entry_id)
+            if not ids:
+                del self._url_index[domain]
+
+    def read_url_index(self, stop: Optional[Callable[[], bool]] = None
+                       ) -> Optional[Tuple[Dict[str, Set[int]], Dict[int, str]]]:
+        """모든 항목을 복호화해 url 필드로 (색인, id → 도메인) 생성 (복호 실패 항목은 건너뜀, verify()로 확인).
+        이 Vault에는 넣지 않으므로 별도 연결의 작업 스레드에서 호출. stop()이 참이 되면 중단하고 None"""
+        assert self.conn and self.key
+        index: Dict[str, Set[int]] = {}
+        url_of: Dict[int, str] = {}
+        cur = self.conn.cursor()
+        cur.execute("SELECT id, display, data FROM entries;")
+        rows = ((row["id"], row["data"], row["display"].encode("utf-8")) for row in cur)
+        for entry_id, data in decrypt_many(self.key, rows):
+            if stop and stop():
+                return None
+            if data is None:
+                continue
+            self._add_url(index, url_of, entry_id, json.loads(data.decode("utf-8")).get("url", ""))
+        return index, url_of
+
+    def install_url_index(self, index: Dict[str, Set[int]], url_of: Dict[int, str]):
+        """read_url_index 결과를 넣고, 만드는 동안 생긴 추가/수정/삭제를 순서대로 재생"""
+        self._url_index, self._url_of = index, url_of
+        pending, self._url_pending = self._url_pending, []
+        for entry_id, url in pending:
+            self._unindex_url(entry_id)
+            if url is not None:
+                self._index_url(entry_id, url)
+
+    def match_url(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """url과 등록 도메인이 같은 항목 (mail.google.com → google.com 항목들).
+        색인이 아직 없으면 None (여기서 만들지 않음)"""
+        assert self.conn and self.key
+        if self._url_index is None:
+            return None
+        ids = sorted(self._url_index.get(url_domain(url), ()))
+        cur = self.conn.cursor()
+        rows = []
+        # 바인드 변수 개수 제한(SQLITE_MAX_VARIABLE_NUMBER)을 넘지 않게 나눠서 조회
+        for i in range(0, len(ids), URL_QUERY_CHUNK):
+            chunk = ids[i:i + URL_QUERY_CHUNK]
+            cur.execute(
+                f"SELECT id, display, updated_at FROM entries WHERE id IN ({','.join('?' * len(chunk))});",
+                chunk,
+            )
+            rows.extend(dict(row) for row in cur.fetchall())
+        rows.sort(key=lambda r: r["updated_at"], reverse=True)
+        return rows
+
     # ---- CRUD ----
     def list_entries(self) -> List[Dict[str, Any]]:
         assert self.conn
@@ -103,6 +234,7 @@ class Vault:
             (display, blob, now, now),
         )
         self.conn.commit()
+        self._index_url(cur.lastrowid, fields.get("url", ""))
         return cur.lastrowid
 
     def get_entry(self, entry_id: int) -> Tuple[str, Dict[str, Any]]:
@@ -127,12 +259,15 @@ class Vault:
             (new_display, blob, now, entry_id),
         )
         self.conn.commit()
+        self._unindex_url(entry_id)
+        self._index_url(entry_id, fields.get("url", ""))
 
     def delete_entry(self, entry_id: int):
         assert self.conn
         cur = self.conn.cursor()
         cur.execute("DELETE FROM entries WHERE id=?;", (entry_id,))
         self.conn.commit()
+        self._unindex_url(entry_id)
 
     def search_entries(self, keyword: str):
         """display 컬럼 LIKE 검색 (대소문자 구분 X는 SQLite collation 설정 필요하므로 우선 단순 LIKE)"""
@@ -143,4 +278,101 @@ class Vault:
             "SELECT id, display, updated_at FROM entries WHERE display LIKE ? ORDER BY updated_at DESC;",
             (kw,),
         )
-        return [dict(row) for row in cur.fetchall()]
\ No newline at end of file
+        return [dict(row) for row in cur.fetchall()]
+
+    # ---- 무결성 검사 ----
+    def verify(self, start_after: int = 0, limit: Optional[int] = None,
+               workers: Optional[int] = None, pool: Optional[Executor] = None) -> Dict[str, Any]:
+        """PRAGMA integrity_check 후 모든 data를 display AAD로 인증(복호)해 깨진 행을 찾는다.
+        id 순으로 검사하며 last_id를 돌려주므로 start_after=last_id로 이어서 재개 가능.
+        limit을 주면 그만큼만 검사(나눠 돌릴 때 사용). 인증은 워커 프로세스들이 나눠 하며,
+        여러 번 호출할 때는 pool(ProcessPoolExecutor)을 넘겨 재사용. 워커가 1개면 현재 프로세스에서 검사."""
+        assert self.conn and self.key
+        cur = self.conn.cursor()
+        integrity = None
+        if start_after == 0:
+            # 전체 DB 검사라 비용이 크므로 처음 시작할 때만 수행
+            cur.execute("PRAGMA integrity_check;")
+            integrity = [row[0] for row in cur.fetchall()]
+
+        own_pool = pool is None and (workers or VERIFY_WORKERS) > 1
+        if own_pool:
+            pool = ProcessPoolExecutor(max_workers=workers or VERIFY_WORKERS)
+        mapper = pool.map if pool else map
+        report = {"integrity": integrity, "checked": 0, "broken": [], "last_id": start_after, "done": False}
+        try:
+            while limit is None or report["checked"] < limit:
+                n = VERIFY_BATCH if limit is None else min(VERIFY_BATCH, limit - report["checked"])
+                cur.execute(
+                    "SELECT id, display, data FROM entries WHERE id > ? ORDER BY id LIMIT ?;",
+                    (report["last_id"], n),
+                )
+                rows = cur.fetchall()
+                if not rows:
+                    report["done"] = True
+                    break
+                displays = {row["id"]: row["display"] for row in rows}
+                items = [(row["id"], row["data"], row["display"].encode("utf-8")) for row in rows]
+                chunks = [items[i:i + VERIFY_CHUNK] for i in range(0, len(items), VERIFY_CHUNK)]
+                for bad in mapper(find_invalid, repeat(self.key, len(chunks)), chunks):
+                    report["broken"].extend({"id": i, "display": displays[i]} for i in bad)
+                report["checked"] += len(rows)
+                report["last_id"] = rows[-1]["id"]
+                if len(rows) < n:
+                    report["done"] = True
+                    break
+        finally:
+            if own_pool:
+                pool.shutdown()
+        return report
+
+    def quarantine_entries(self, entry_ids: List[int], reason: str = "인증 실패"):
+        """깨진 행을 entries에서 quarantine 테이블로 옮김 (원본 보존, 목록에서는 제외)"""
+        assert self.conn
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        cur = self.conn.cursor()
+        for entry_id in entry_ids:
+            cur.execute(
+                "INSERT OR REPLACE INTO quarantine(id, display, data, created_at, updated_at, reason, quarantined_at) "
+                "SELECT id, display, data, created_at, updated_at, ?, ? FROM entries WHERE id=?;",
+                (reason, now, entry_id),
+            )
+            cur.execute("DELETE FROM entries WHERE id=?;", (entry_id,))
+            self._unindex_url(entry_id)
+        self.conn.commit()
+
+    def list_quarantined(self) -> List[Dict[str, Any]]:
+        assert self.conn
+        cur = self.conn.cursor()
+        cur.execute("SELECT id, display, updated_at, reason, quarantined_at FROM quarantine ORDER BY id;")
+        return [dict(row) for row in cur.fetchall()]
+
+    def restore_quarantined(self, entry_id: int) -> bool:
+        """격리된 행을 entries로 되돌림 (display를 외부에서 원래대로 고친 경우 등).
+        되돌린 행이 인증(복호)되면 True, 여전히 깨져 있으면 False (다음 검사에서 다시 잡힘)"""
+        assert self.conn and self.key
+        cur = self.conn.cursor()
+        cur.execute(
+            "INSERT INTO entries(id, display, data, created_at, updated_at) "
+            "SELECT id, display, data, created_at, updated_at FROM quarantine WHERE id=?;",
+            (entry_id,),
+        )
+        if cur.rowcount == 0:
+            raise KeyError(f"id={entry_id} 없음")
+        cur.execute("DELETE FROM quarantine WHERE id=?;", (entry_id,))
+        self.conn.commit()
+        try:
+            _, fields = self.get_entry(entry_id)
+        except Exception:
+            return False
+        self._index_url(entry_id, fields.get("url", ""))
+        return True
+
+    def purge_quarantined(self, entry_id: int):
+        """격리된 행을 완전히 삭제 (복구 불가)"""
+        assert self.conn
+        cur = self.conn.cursor()
+        cur.execute("DELETE FROM quarantine WHERE id=?;", (entry_id,))
+        if cur.rowcount == 0:
+            raise KeyError(f"id={entry_id} 없음")
+        self.conn.commit()
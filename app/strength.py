@@ -0,0 +1,525 @@
+# app/strength.py
+# zxcvbn 방식 비밀번호 강도 추정.
+# 사전 단어(+l33t 치환), 키보드 패턴, 반복, 연속 문자, 날짜를 찾아
+# 추측 횟수(guesses)가 가장 적은 분해를 구하고 0~4 점수로 환산한다.
+import mmap, re, struct
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from math import comb, factorial
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple
+
+from app.utils import resource_path
+
+DICT_PATH = Path(resource_path("app/data/strength.dict"))
+DICT_MAGIC = b"PWD1"
+DICT_SCAN_BYTES = 4096              # 접두어 구간이 이보다 작으면 이진 탐색 대신 한 번에 읽어 찾음
+DICT_CACHE_SIZE = 65536             # 사전 조회 결과 캐시 항목 수 (넘치면 비움)
+DICT_SCAN_MEMO = 16                 # 이어서 확장할 수 있게 사전 탐색 상태를 기억해 둘 최근 입력 수
+
+MAX_LEN = 64                        # 이보다 긴 부분은 분석 생략(보수적으로 낮게 추정, 입력마다 1ms 이내 유지)
+MIN_GUESSES_SEQUENCE = 10_000       # 패턴 개수가 늘어날 때의 추가 비용
+MAX_MATCHES = 6                     # 분해 구간 수 상한: 6개면 추가 비용만 1e20 > 최고 점수 기준이라 점수는 그대로
+BRUTEFORCE_CARDINALITY = 10
+REFERENCE_YEAR = date.today().year
+MIN_YEAR_SPACE = 20
+SCORE_THRESHOLDS = (1e3, 1e6, 1e8, 1e10)
+GUESSES_CAP = SCORE_THRESHOLDS[-1] + 5     # 이 이상은 최고 점수라 정확히 구하지 않음 (estimate의 점수 환산과 같은 경계)
+SCORE_LABELS = ("매우 약함", "약함", "보통", "강함", "매우 강함")
+
+L33T_TABLE = {
+    "4": "a", "@": "a", "8": "b", "(": "c", "{": "c", "[": "c", "<": "c",
+    "3": "e", "6": "g", "9": "g", "1": "il", "!": "i", "|": "il",
+    "7": "lt", "0": "o", "$": "s", "5": "s", "+": "t", "%": "x", "2": "z",
+}
+
+WARNINGS = {
+    "dictionary": "흔한 단어나 자주 쓰이는 비밀번호가 포함되어 있습니다.",
+    "l33t": "@→a 같은 기호 치환은 추측을 크게 어렵게 하지 않습니다.",
+    "spatial": "키보드 배열을 따라 누른 패턴은 추측하기 쉽습니다.",
+    "repeat": "반복되는 문자열은 추측하기 쉽습니다.",
+    "sequence": "abc, 123 같은 연속 문자는 추측하기 쉽습니다.",
+    "date": "날짜나 연도는 추측하기 쉽습니다.",
+}
+
+
+@dataclass
+class Match:
+    pattern: str        # dictionary / spatial / repeat / sequence / date / bruteforce
+    i: int              # 시작 위치
+    j: int              # 끝 위치(포함하지 않음)
+    guesses: float
+
+
+@dataclass
+class Strength:
+    score: int                      # 0~4
+    guesses: float
+    sequence: List[Match] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return SCORE_LABELS[self.score]
+
+    @property
+    def warning(self) -> str:
+        if self.score >= 3:
+            return ""
+        found = [m for m in self.sequence if m.pattern != "bruteforce"]
+        if not found:
+            return "더 길게 만드세요." if self.score < 2 else ""
+        m = max(found, key=lambda m: m.j - m.i)
+        return WARNINGS[m.pattern]
+
+
+# ----------------- 사전 (mmap, 지연 로딩) -----------------
+class _SortedDict:
+    """tools/build_strength_dict.py 로 만든 정렬 파일을 mmap으로 열어 이진 탐색"""
+    def __init__(self, path: Path):
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:4] != DICT_MAGIC:
+            raise ValueError(f"사전 파일 형식 오류: {path}")
+        self._index = struct.unpack_from("<257I", self._mm, 4)
+
+        self.full_range = (self._index[0], self._index[256])
+        self._pairs: Dict[bytes, Tuple[int, int]] = {}     # 두 바이트 접두어 구간 (첫 구간이 커서 따로 보관)
+        # lookup 결과 캐시. 단어가 접두어 구간을 정하므로 단어만 키로 씀 (매처에서 직접 조회해 호출 비용 절약)
+        self.found: Dict[bytes, Tuple[Optional[int], bool, int, int]] = {}
+
+    def _lower_bound(self, word: bytes, lo: int, hi: int) -> int:
+        """[lo, hi) 안에서 word 이상인 첫 줄의 시작 오프셋 (lo, hi는 항상 줄 시작)"""
+        mm = self._mm
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b"\n", lo, mid) + 1 or lo
+            tab = mm.find(b"\t", start)
+            if mm[start:tab] < word:
+                lo = mm.find(b"\n", tab) + 1
+            else:
+                hi = start
+        return lo
+
+    def _scan(self, word: bytes, lo: int, hi: int) -> Tuple[int, int]:
+        """작은 구간을 통째로 읽어 word로 시작하는 줄들의 구간 반환 (정렬돼 있어 연속)"""
+        block = b"\n" + self._mm[lo:hi]       # block[i]는 mm[lo + i - 1]
+        key = b"\n" + word
+        p = block.find(key)
+        if p < 0:
+            return hi, hi
+        end = block.find(b"\n", block.rfind(key) + 1)
+        return lo + p, lo + end
+
+    def lookup(self, word: bytes, lo: int, hi: int) -> Tuple[Optional[int], bool, int, int]:
+        """(word의 순위 또는 None, word로 시작하는 더 긴 단어가 있는지, word 접두어 구간)
+        lo, hi에 word[:-1]의 접두어 구간을 넘기면 그 안에서만 탐색. 결과는 found에 보관"""
+        if len(self.found) >= DICT_CACHE_SIZE:
+            self.found.clear()
+        r = self.found[word] = self._lookup(word, lo, hi)
+        return r
+
+    def _lookup(self, word: bytes, lo: int, hi: int) -> Tuple[Optional[int], bool, int, int]:
+        mm = self._mm
+        if len(word) == 1:
+            # 첫 바이트 구간은 헤더 색인에 미리 계산되어 있음
+            lo, hi = self._index[word[0]], self._index[word[0] + 1]
+        elif len(word) == 2 and word in self._pairs:
+            lo, hi = self._pairs[word]
+        elif hi - lo <= DICT_SCAN_BYTES:
+            lo, hi = self._scan(word, lo, hi)
+        else:
+            lo = self._lower_bound(word, lo, hi)
+            # UTF-8에는 0xff가 없으므로 word+0xff는 word로 시작하는 모든 단어보다 큼
+            hi = self._lower_bound(word + b"\xff", lo, hi)
+            if len(word) == 2:
+                self._pairs[word] = (lo, hi)
+        if lo >= hi:
+            return None, False, lo, hi
+        tab = mm.find(b"\t", lo)
+        if tab - lo != len(word):
+            return None, True, lo, hi
+        nl = mm.find(b"\n", tab)
+        return int(mm[tab + 1:nl]), nl + 1 < hi, lo, hi
+
+
+_dict: Optional[_SortedDict] = None
+
+def _get_dict() -> _SortedDict:
+    """사전이 없으면 점수가 부풀려지므로 조용히 넘어가지 않고 오류를 낸다"""
+    global _dict
+    if _dict is None:
+        if not DICT_PATH.exists():
+            raise FileNotFoundError(f"강도 추정 사전이 없습니다: {DICT_PATH}")
+        _dict = _SortedDict(DICT_PATH)
+    return _dict
+
+
+# ----------------- 매처 -----------------
+@lru_cache(maxsize=1024)
+def _alternatives(c: str) -> Tuple[Tuple[bytes, int], ...]:
+    """입력 문자 c가 사전에서 나타낼 수 있는 문자들 (바이트, 치환 여부)"""
+    c = c.lower()
+    return ((c.encode("utf-8"), 0),) + tuple((s.encode("utf-8"), 1) for s in L33T_TABLE.get(c, ""))
+
+def _uppercase_variations(token: str) -> int:
+    if token.lower() == token:
+        return 1
+    upper = sum(c.isupper() for c in token)
+    lower = sum(c.islower() for c in token)
+    if upper == 0:
+        return 1
+    if lower == 0 or (upper == 1 and (token[0].isupper() or token[-1].isupper())):
+        return 2
+    return sum(comb(upper + lower, k) for k in range(1, min(upper, lower) + 1))
+
+Frontier = List[Tuple[bytes, int, int, int]]     # (지금까지의 사전 접두어, 치환 수, 접두어 구간)
+# 최근 입력별 시작 위치마다 (찾은 매치, 아직 살아 있는 접두어들 또는 None). 입력 중에는 한 글자씩
+# 늘어나므로 직전 입력의 결과를 이어 받아 살아 있는 접두어만 새 글자로 확장한다
+_scans: Dict[str, List[Tuple[List[Match], Optional[Frontier]]]] = {}
+
+def _extend(d: _SortedDict, pw: str, has_upper: bool, i: int, j: int,
+            frontier: Frontier, out: List[Match]) -> Optional[Frontier]:
+    """시작 i의 접두어들을 pw[j:]로 확장하며 찾은 단어를 out에 추가. 끝까지 살아 있으면 그 접두어들"""
+    lookup, found = d.lookup, d.found
+    for j in range(j, len(pw)):
+        nxt = []
+        upper = 0                           # 대소문자 변형 수, 단어를 찾았을 때만 계산
+        for prefix, subs, lo, hi in frontier:
+            for s, n in _alternatives(pw[j]):
+                w = prefix + s
+                r = found.get(w) or lookup(w, lo, hi)
+                if r[0] is not None:
+                    if not upper:
+                        upper = _uppercase_variations(pw[i:j + 1]) if has_upper else 1
+                    g = r[0] * upper
+                    if subs + n:
+                        g *= 2 ** (subs + n)
+                    out.append(Match("l33t" if subs + n else "dictionary", i, j + 1, g))
+                if r[1]:
+                    nxt.append((w, subs + n, r[2], r[3]))
+        if not nxt:
+            return None
+        frontier = nxt
+    return frontier
+
+def dictionary_matches(pw: str) -> List[Match]:
+    """사전 단어 + l33t 치환. 시작 위치마다 접두어가 사전에 있는 동안만 확장"""
+    starts = _scans.get(pw)
+    if starts is None:
+        d = _get_dict()
+        lo, hi = d.full_range
+        has_upper = pw.lower() != pw
+        prev = _scans.get(pw[:-1], [])
+        starts = []
+        for i in range(len(pw)):
+            if i < len(prev):
+                ms, frontier = prev[i]
+                if frontier is not None:
+                    ms = list(ms)
+                    frontier = _extend(d, pw, has_upper, i, len(pw) - 1, frontier, ms)
+            else:
+                ms = []
+                frontier = _extend(d, pw, has_upper, i, i, [(b"", 0, lo, hi)], ms)
+            starts.append((ms, frontier))
+        if len(_scans) >= DICT_SCAN_MEMO:
+            _scans.clear()
+        _scans[pw] = starts
+    return [m for ms, _ in starts for m in ms]
+
+
+def _build_keyboard() -> Tuple[Dict[str, Tuple[int, int]], Dict[Tuple[int, int], str]]:
+    # (일반, shift, 시작 열). 숫자 줄은 `가 q보다 왼쪽에 있어 한 칸 당김: q 위는 1과 2
+    rows = (("`1234567890-=", "~!@#$%^&*()_+", -1),
+            ("qwertyuiop[]\\", "QWERTYUIOP{}|", 0),
+            ("asdfghjkl;'", 'ASDFGHJKL:"', 0),
+            ("zxcvbnm,./", "ZXCVBNM<>?", 0))
+    pos, key_at = {}, {}
+    for r, (plain, shifted, start) in enumerate(rows):
+        for c, (a, b) in enumerate(zip(plain, shifted), start):
+            pos[a] = pos[b] = (r, c)
+            key_at[(r, c)] = a
+    return pos, key_at
+
+KEY_POS, _KEY_AT = _build_keyboard()
+SHIFTED = set('~!@#$%^&*()_+QWERTYUIOP{}|ASDFGHJKL:"ZXCVBNM<>?')
+# 엇갈린 키 배열: 윗줄은 (c, c+1), 아랫줄은 (c-1, c)가 이웃
+KEY_DIRS = ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, -1), (1, 0))
+KEY_STARTS = len(_KEY_AT)
+KEY_DEGREE = sum(sum((r + dr, c + dc) in _KEY_AT for dr, dc in KEY_DIRS)
+                 for r, c in _KEY_AT) / KEY_STARTS
+
+def _spatial_guesses(length: int, turns: int, shifted: int) -> float:
+    g = 0
+    for i in range(2, length + 1):
+        for t in range(1, min(turns, i - 1) + 1):
+            g += comb(i - 1, t - 1) * KEY_STARTS * KEY_DEGREE ** t
+    if shifted:
+        unshifted = length - shifted
+        g *= 2 if unshifted == 0 else sum(comb(length, k) for k in range(1, min(shifted, unshifted) + 1))
+    return g
+
+def spatial_matches(pw: str) -> List[Match]:
+    out = []
+    i = 0
+    while i < len(pw) - 2:
+        j, turns, last_dir = i + 1, 0, None
+        while j < len(pw) and pw[j - 1] in KEY_POS and pw[j] in KEY_POS:
+            (r0, c0), (r1, c1) = KEY_POS[pw[j - 1]], KEY_POS[pw[j]]
+            step = (r1 - r0, c1 - c0)
+            if step not in KEY_DIRS:
+                break
+            if step != last_dir:
+                turns += 1
+                last_dir = step
+            j += 1
+        if j - i >= 3:
+            shifted = sum(ch in SHIFTED for ch in pw[i:j])
+            out.append(Match("spatial", i, j, _spatial_guesses(j - i, turns, shifted)))
+            i = j - 1
+        else:
+            i += 1
+    return out
+
+
+def sequence_matches(pw: str) -> List[Match]:
+    """abc, 9876, aceg 처럼 일정 간격(|d|<=5)으로 이어지는 문자"""
+    out = []
+    i = 0
+    while i < len(pw) - 2:
+        delta = ord(pw[i + 1]) - ord(pw[i])
+        j = i + 2
+        while j < len(pw) and ord(pw[j]) - ord(pw[j - 1]) == delta:
+            j += 1
+        if j - i >= 3 and 0 < abs(delta) <= 5:
+            first = pw[i]
+            if first in "aAzZ019":
+                base = 4
+            elif first.isdigit():
+                base = 10
+            else:
+                base = 26
+            out.append(Match("sequence", i, j, base * (j - i) * (1 if delta > 0 else 2)))
+        # 같은 간격이 이어진 구간 안에서는 다른 연속이 시작될 수 없으므로 끝에서 다시 시작
+        i = j - 1
+    return out
+
+
+_REPEAT_GREEDY = re.compile(r"(.+)\1+")
+_REPEAT_LAZY = re.compile(r"(.+?)\1+")
+
+def repeat_matches(pw: str) -> List[Match]:
+    out = []
+    pos = 0
+    while pos < len(pw):
+        g, lz = _REPEAT_GREEDY.search(pw, pos), _REPEAT_LAZY.search(pw, pos)
+        if not g:
+            break
+        if len(g.group(0)) > len(lz.group(0)):
+            m = g
+            base = _REPEAT_LAZY.fullmatch(m.group(0)).group(1)
+        else:
+            m, base = lz, lz.group(1)
+        count = len(m.group(0)) // len(base)
+        out.append(Match("repeat", m.start(), m.end(), _base_guesses(base) * count))
+        pos = m.end()
+    return out
+
+
+@lru_cache(maxsize=256)
+def _base_guesses(base: str) -> float:
+    """반복 단위의 추측 수. 단위는 원래 길이의 절반 이하라 재귀가 빠르게 끝남"""
+    return estimate(base).guesses if len(base) > 1 else BRUTEFORCE_CARDINALITY
+
+
+_DATE_SEP = re.compile(r"(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})")
+_YEAR = re.compile(r"19\d\d|20\d\d")
+
+def _full_year(y: int) -> Optional[int]:
+    if y < 100:
+        y += 2000 if y <= 50 else 1900
+    return y if 1000 <= y <= REFERENCE_YEAR + 25 else None
+
+def _plausible_date(parts: Tuple[int, ...]) -> Optional[int]:
+    """(a, b, c) 중 연-월-일 조합(연-월-일, 연-일-월, 월-일-연, 일-월-연)이 가능하면 연도 반환.
+    숫자만 긴 입력에서는 토큰마다 불리므로 월/일 범위부터 싸게 거름"""
+    a, b, c = parts
+    if 1 <= b <= 31 and 1 <= c <= 31 and (b <= 12 or c <= 12):
+        year = _full_year(a)
+        if year:
+            return year
+    if 1 <= a <= 31 and 1 <= b <= 31 and (a <= 12 or b <= 12):
+        return _full_year(c)
+    return None
+
+def _date_guesses(year: int, sep: bool) -> float:
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE) * 365 * (4 if sep else 1)
+
+_DATE_SPLITS = {4: ((1, 2), (2, 3)), 5: ((1, 3), (2, 3)), 6: ((1, 2), (2, 4), (4, 5)),
+                7: ((1, 3), (4, 5), (4, 6)), 8: ((2, 4), (4, 6))}
+
+@lru_cache(maxsize=4096)
+def _digit_date_guesses(tok: str) -> Optional[float]:
+    """구분자 없는 숫자열(4~8자)이 날짜로 읽히면 추측 수. 입력 중 같은 부분 문자열을 반복해 보므로 캐시"""
+    for a, b in _DATE_SPLITS[len(tok)]:
+        year = _plausible_date((int(tok[:a]), int(tok[a:b]), int(tok[b:])))
+        if year:
+            return _date_guesses(year, False)
+    return None
+
+def date_matches(pw: str) -> List[Match]:
+    out = []
+    # 구분자 없는 숫자열: 19900415, 900415, 0415 등. 시작마다 긴 것부터 보고, 앞에서 찾은 날짜 안에
+    # 들어가는 짧은 후보(어차피 아래에서 버려짐)는 아예 확인하지 않음
+    n = len(pw)
+    digit_end = [n] * (n + 1)           # digit_end[i]: i부터 이어지는 숫자열의 끝
+    for i in range(n - 1, -1, -1):
+        digit_end[i] = digit_end[i + 1] if pw[i].isdigit() else i
+    far = 0
+    for i in range(n - 3):
+        for j in range(min(i + 8, digit_end[i]), max(i + 4, far + 1) - 1, -1):
+            g = _digit_date_guesses(pw[i:j])
+            if g:
+                out.append(Match("date", i, j, g))
+                far = j
+                break
+    for m in _DATE_SEP.finditer(pw):
+        year = _plausible_date((int(m.group(1)), int(m.group(3)), int(m.group(4))))
+        if year:
+            out.append(Match("date", m.start(), m.end(), _date_guesses(year, True)))
+    for m in _YEAR.finditer(pw):
+        out.append(Match("date", m.start(), m.end(), max(abs(int(m.group(0)) - REFERENCE_YEAR), MIN_YEAR_SPACE)))
+    # 다른 날짜 안에 포함되는 짧은 날짜는 버림 (zxcvbn과 같음, DP 입력 축소).
+    # 시작 오름차순·끝 내림차순으로 정렬하면 앞선 매치 중 가장 멀리 끝나는 것만 보면 됨.
+    # 남는 매치는 끝이 계속 늘어나므로 시작 위치마다 하나 이하(숫자 64자여도 61개 이하)
+    out.sort(key=lambda m: (m.i, -m.j))
+    kept, cover = [], None
+    for m in out:
+        if cover is not None and (m.j < cover.j or (m.j == cover.j and m.i > cover.i)):
+            continue
+        kept.append(m)
+        if cover is None or m.j > cover.j:
+            cover = m
+    return kept
+
+
+# ----------------- 최소 추측 분해 -----------------
+# 길이별 무작위 문자 추측 수 (1자는 11, 그 이상은 최소 51)
+_BRUTEFORCE = [0, 11] + [max(BRUTEFORCE_CARDINALITY ** n, 51) for n in range(2, MAX_LEN + 1)]
+_FACT = [factorial(l) for l in range(MAX_MATCHES + 1)]
+_SEQ_COST = [0] + [MIN_GUESSES_SEQUENCE ** (l - 1) for l in range(1, MAX_MATCHES + 1)]
+
+def _greedy_split(n: int, matches: List[Match]) -> Tuple[float, List[Match]]:
+    """각 위치에서 가장 긴 매치를 고르고 사이는 무작위로 채운 분해와 그 추측 수 (DP 가지치기 상한)"""
+    longest: Dict[int, Match] = {}
+    for m in matches:
+        o = longest.get(m.i)
+        if o is None or (m.j, -m.guesses) > (o.j, -o.guesses):
+            longest[m.i] = m
+    seq, prod, pos, bf_start = [], 1, 0, None
+    while pos < n:
+        m = longest.get(pos)
+        if m is None:
+            bf_start = pos if bf_start is None else bf_start
+            pos += 1
+            continue
+        if bf_start is not None:
+            seq.append(Match("bruteforce", bf_start, pos, _BRUTEFORCE[pos - bf_start]))
+            bf_start = None
+        seq.append(m)
+        pos = m.j
+    if bf_start is not None:
+        seq.append(Match("bruteforce", bf_start, n, _BRUTEFORCE[n - bf_start]))
+    full = _BRUTEFORCE[n] + 1        # 전부 무작위(l=1)는 항상 DP에서 도달 가능
+    if len(seq) > MAX_MATCHES:
+        return full, [Match("bruteforce", 0, n, _BRUTEFORCE[n])]
+    for m in seq:
+        prod *= m.guesses
+    g = _FACT[len(seq)] * prod + _SEQ_COST[len(seq)]
+    if g >= full:
+        return full, [Match("bruteforce", 0, n, _BRUTEFORCE[n])]
+    return g, seq
+
+def _most_guessable(pw: str, matches: List[Match]) -> Tuple[float, List[Match]]:
+    """구간을 매치/무작위 문자로 나누는 방법 중 l! * Π guesses + D^(l-1)이 최소인 것"""
+    n = len(pw)
+    # 같은 구간의 매치는 추측 수가 가장 적은 것만 남김
+    best_span: Dict[Tuple[int, int], Match] = {}
+    for m in matches:
+        o = best_span.get((m.i, m.j))
+        if o is None or m.guesses < o.guesses:
+            best_span[(m.i, m.j)] = m
+    matches = list(best_span.values())
+    by_end: Dict[int, List[Match]] = {}
+    for m in matches:
+        by_end.setdefault(m.j, []).append(m)
+    # 무작위 구간은 매치 사이만 채우면 되므로 시작은 0/매치 끝, 끝은 n/매치 시작으로 한정
+    bf_starts = sorted({0} | {m.j for m in matches})
+    bf_ends = {n} | {m.i for m in matches}
+    # states[k][bf] = {l: (prod, back)} — bf: 마지막 구간이 무작위 문자인지
+    states = [({}, {}) for _ in range(n + 1)]
+    states[0][0][0] = (1, None)
+    # 상한: 탐욕 분해(각 위치에서 가장 긴 매치, 사이는 무작위)의 추측 수. l과 prod는 늘기만 하므로
+    # 중간 상태의 l! * prod + D^(l-1)이 이를 넘으면 더 볼 필요 없음.
+    # GUESSES_CAP을 넘으면 점수가 같으므로 그 이상은 정확히 구하지 않고 탐욕 분해를 그대로 씀
+    greedy, greedy_seq = _greedy_split(n, matches)
+    bound = min(greedy, GUESSES_CAP)
+
+    def put(table, l, prod, back):
+        # 상한은 호출 전에 확인. 구간 수와 곱이 모두 같거나 작은 상태가 있으면 버림
+        for l2, (p2, _) in table.items():
+            if l2 <= l and p2 <= prod:
+                return
+        table[l] = (prod, back)
+
+    bf_start_set = set(bf_starts)
+    live_starts = [0]           # 무작위 구간을 시작할 수 있는(매치로 끝난 상태가 있는) 위치
+    # 읽는 상태(위치 < k)와 쓰는 상태(위치 k)가 달라 순회 중 복사 없이 갱신 가능
+    for k in range(1, n + 1):
+        for m in by_end.get(k, ()):
+            for bf in (0, 1):
+                for l, (prod, _) in states[m.i][bf].items():
+                    p = prod * m.guesses
+                    if l < MAX_MATCHES and _FACT[l + 1] * p + _SEQ_COST[l + 1] <= bound:
+                        put(states[k][0], l + 1, p, (m.i, bf, l, m))
+        if k in bf_ends:
+            # 모든 추측 수가 1 이상이라 무작위 구간 하나만으로 상한을 넘으면 더 먼 시작도 안 됨
+            for i in reversed(live_starts):
+                g = _BRUTEFORCE[k - i]
+                if g > bound:
+                    break
+                for l, (prod, _) in states[i][0].items():
+                    p = prod * g
+                    if l < MAX_MATCHES and _FACT[l + 1] * p + _SEQ_COST[l + 1] <= bound:
+                        put(states[k][1], l + 1, p, (i, 0, l, None))
+        if k in bf_start_set and states[k][0]:
+            live_starts.append(k)
+
+    best, best_key = None, None
+    for bf in (0, 1):
+        for l, (prod, _) in states[n][bf].items():
+            g = _FACT[l] * prod + _SEQ_COST[l]
+            if best is None or g < best:
+                best, best_key = g, (n, bf, l)
+    if best is None:
+        return greedy, greedy_seq
+    seq = []
+    k, bf, l = best_key
+    while k > 0:
+        _, back = states[k][bf][l]
+        i, bf, l, m = back
+        seq.append(m or Match("bruteforce", i, k, _BRUTEFORCE[k - i]))
+        k = i
+    seq.reverse()
+    return best, seq
+
+def estimate(password: str) -> Strength:
+    """비밀번호 강도 추정. 입력 중 매 키마다 호출해도 될 만큼 가볍게 유지"""
+    if not password:
+        return Strength(0, 0)
+    pw = password[:MAX_LEN]
+    matches = (dictionary_matches(pw) + spatial_matches(pw) + sequence_matches(pw)
+               + repeat_matches(pw) + date_matches(pw))
+    guesses, seq = _most_guessable(pw, matches)
+    score = sum(guesses >= t + 5 for t in SCORE_THRESHOLDS)
+    return Strength(score, guesses, seq)
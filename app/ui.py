@@ -1,10 +1,15 @@
 # app/ui.py
+import queue, sqlite3, threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 
-from app.store import Vault
-from app.utils import json_prompt_defaults, CLIPBOARD_CLEAR_SEC, AUTO_LOCK_MIN
-from app.generator import generate, GenOptions
+from app.store import (Vault, verify_pool, verify_state_path, load_verify_state, save_verify_state,
+                       merge_verify_report)
+from app.utils import json_prompt_defaults, CLIPBOARD_CLEAR_SEC, AUTO_LOCK_MIN, VERIFY_STEP_ROWS, VERIFY_STEP_MS
+from app.generator import generate, generate_scored, GenOptions
+from app.strength import estimate
+
+STRENGTH_COLORS = ("#D92D20", "#F04438", "#F79009", "#12B76A", "#067647")
 
 def setup_theme():
     style = ttk.Style()
@@ -135,7 +140,7 @@ class LoginFrame(ttk.Frame):
     def _show_help(self):
         tips = (
             "• 마스터 비밀번호는 분실 시 복구할 수 없습니다.\n"
-            "• 12자 이상 복잡한 비밀번호 권장.\n"
+            "• 12자 이상 복잡한 비밀번호 권장(항목 추가/수정 시 강도가 표시됩니다).\n"
             "• 앱은 로컬에서만 동작합니다.\n"
             "• 일정 시간 미사용 시 자동 잠금.\n"
             "• 복사한 비밀번호는 잠시 후 클립보드에서 자동 삭제됩니다."
@@ -269,6 +274,64 @@ class DetailDialog(tk.Toplevel):
             self._last_clip = None
 
 
+# ----------------- 비밀번호 입력 다이얼로그 -----------------
+class PasswordDialog(simpledialog.Dialog):
+    """비밀번호 입력 + 입력 중 강도 표시 + 생성 버튼"""
+    def __init__(self, master, title, initialvalue=""):
+        self.initialvalue = initialvalue
+        self._generating = False
+        super().__init__(master, title)
+
+    def body(self, frm):
+        ttk.Label(frm, text="비밀번호:").grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 4))
+        self.pw_var = tk.StringVar(value=self.initialvalue)
+        self.pw_entry = ttk.Entry(frm, textvariable=self.pw_var, width=34, show="*")
+        self.pw_entry.grid(row=1, column=0, sticky="we")
+        ttk.Button(frm, text="생성", width=6, command=self._generate).grid(row=1, column=1, padx=(6, 0))
+
+        self.strength_lbl = tk.Label(frm, text="", font=("Segoe UI", 9, "bold"))
+        self.strength_lbl.grid(row=2, column=0, columnspan=2, sticky="w", pady=(6, 0))
+        self.warning_lbl = tk.Label(frm, text="", fg="#667085", font=("Segoe UI", 9),
+                                    wraplength=300, justify="left")
+        self.warning_lbl.grid(row=3, column=0, columnspan=2, sticky="w")
+
+        self.pw_var.trace_add("write", lambda *_: self._generating or self._show_strength())
+        self._show_strength()
+        return self.pw_entry
+
+    def _generate(self):
+        try:
+            pw, st = generate_scored(GenOptions())
+        except FileNotFoundError:
+            pw, st = generate(GenOptions()), None
+        self._generating = True
+        self.pw_var.set(pw)
+        self._generating = False
+        self.pw_entry.configure(show="")
+        self._show_strength(st)
+
+    def _show_strength(self, st=None):
+        pw = self.pw_var.get()
+        if not pw:
+            self.strength_lbl.configure(text="")
+            self.warning_lbl.configure(text="")
+            return
+        try:
+            st = st or estimate(pw)
+        except FileNotFoundError as e:
+            self.strength_lbl.configure(text="강도를 확인할 수 없습니다.", fg=STRENGTH_COLORS[0])
+            self.warning_lbl.configure(text=str(e))
+            return
+        self.strength_lbl.configure(text=f"강도: {st.label} ({st.score}/4)", fg=STRENGTH_COLORS[st.score])
+        self.warning_lbl.configure(text=st.warning)
+
+    def apply(self):
+        self.result = self.pw_var.get()
+
+def ask_password(parent, title, initialvalue=""):
+    return PasswordDialog(parent, title, initialvalue).result
+
+
 # ----------------- 메인 윈도우 -----------------
 class MainFrame(ttk.Frame):
     def __init__(self, master, vault, switch_to_login):
@@ -313,6 +376,13 @@ class MainFrame(ttk.Frame):
         self.search_var = tk.StringVar()
         self.search_var.trace_add("write", lambda *_: self.refresh())
         ttk.Entry(right_search, textvariable=self.search_var, width=26).pack(side="left")
+        ttk.Label(right_search, text="URL").pack(side="left", padx=(12,6))
+        self.url_var = tk.StringVar()
+        self.url_var.trace_add("write", lambda *_: self.refresh())
+        ttk.Entry(right_search, textvariable=self.url_var, width=26).pack(side="left")
+        self.url_status = ttk.Label(right_search, text="", foreground="#667085")
+        self.url_status.pack(side="left", padx=(6,0))
+        self._index_failed = False
 
         # 리스트
         self.tree = ttk.Treeview(self, columns=("display","updated"), show="headings", height=16)
@@ -336,15 +406,40 @@ class MainFrame(ttk.Frame):
             self.master.bind_all(seq, self._reset_idle_timer, add="+")
         self._reset_idle_timer()
 
+        # 잠금 해제 후 백그라운드 URL 색인 생성/무결성 검사 (작업 스레드 + 별도 연결, 결과는 큐로 받음)
+        self._bg_stop = threading.Event()
+        self._index_out = queue.Queue()
+        threading.Thread(target=self._index_worker, daemon=True,
+                         args=(self.vault.db_path, self.vault.key, self._bg_stop, self._index_out)).start()
+        self.after(VERIFY_STEP_MS, self._index_poll)
+        self._verify_out = queue.Queue()
+        threading.Thread(target=self._verify_worker, daemon=True,
+                         args=(self.vault.db_path, self.vault.key, self._bg_stop, self._verify_out)).start()
+        self.after(VERIFY_STEP_MS, self._verify_poll)
+        self.bind("<Destroy>", lambda e: self._bg_stop.set(), add="+")
+
     def _lock_now(self):
+        self._bg_stop.set()
         self.vault.lock()
         self.switch_to_login()
 
     # ----- 목록/검색 -----
     def refresh(self):
         keyword = (self.search_var.get() or "").strip()
+        url = (self.url_var.get() or "").strip()
         for i in self.tree.get_children(): self.tree.delete(i)
-        rows = self.vault.search_entries(keyword) if keyword else self.vault.list_entries()
+        self.url_status.config(text="")
+        if url:
+            # URL로 찾은 뒤 이름 검색어가 있으면 함께 적용 (search_entries의 LIKE처럼 대소문자 무시)
+            rows = self.vault.match_url(url)
+            if rows is None:
+                # 색인이 아직 만들어지는 중: 막지 않고 표시만, 다 되면 _index_poll이 다시 refresh
+                self.url_status.config(text="색인 생성 실패" if self._index_failed else "색인 생성 중…")
+                return
+            if keyword:
+                rows = [r for r in rows if keyword.lower() in r["display"].lower()]
+        else:
+            rows = self.vault.search_entries(keyword) if keyword else self.vault.list_entries()
         for idx, row in enumerate(rows):
             tag = "oddrow" if idx % 2 else "evenrow"
             self.tree.insert("", "end", iid=str(row["id"]), values=(row["display"], row["updated_at"]), tags=(tag,))
@@ -362,7 +457,7 @@ class MainFrame(ttk.Frame):
         if not display: return
         fields = json_prompt_defaults()
         fields["username"] = simpledialog.askstring("사용자명", "사용자명:", parent=self) or ""
-        fields["password"] = simpledialog.askstring("비밀번호", "비밀번호:", parent=self, show="*") or ""
+        fields["password"] = ask_password(self, "비밀번호") or ""
         fields["url"] = simpledialog.askstring("URL", "로그인 URL(선택):", parent=self) or ""
         fields["notes"] = simpledialog.askstring("메모", "메모(선택):", parent=self) or ""
         self.vault.add_entry(display, fields); self.refresh()
@@ -374,7 +469,7 @@ class MainFrame(ttk.Frame):
         new_display = simpledialog.askstring("이름", "표시 이름:", initialvalue=display, parent=self)
         if new_display is None: return
         username = simpledialog.askstring("사용자명", "사용자명:", initialvalue=fields.get("username",""), parent=self) or ""
-        password = simpledialog.askstring("비밀번호", "비밀번호:", initialvalue=fields.get("password",""), parent=self, show="*") or ""
+        password = ask_password(self, "비밀번호", initialvalue=fields.get("password","")) or ""
         url = simpledialog.askstring("URL", "URL:", initialvalue=fields.get("url",""), parent=self) or ""
         notes = simpledialog.askstring("메모", "메모:", initialvalue=fields.get("notes",""), parent=self) or ""
         self.vault.update_entry(entry_id, new_display, {
@@ -399,6 +494,97 @@ class MainFrame(ttk.Frame):
             self.after_cancel(self._idle_after_id)
         self._idle_after_id = self.after(int(AUTO_LOCK_MIN * 60 * 1000), self._lock_now)
 
+    # ----- 백그라운드 URL 색인 -----
+    @staticmethod
+    def _index_worker(db_path, key, stop, out):
+        """작업 스레드: URL 색인을 만들어 out 큐에 넣음 (Tk 호출 금지, 넣는 것은 _index_poll이 Tk 스레드에서)"""
+        v = Vault(db_path)
+        v.key = key
+        try:
+            v.connect()
+            built = v.read_url_index(stop.is_set)
+            if built is not None:
+                out.put(built)
+        except (sqlite3.DatabaseError, OSError) as e:
+            out.put(e)
+        finally:
+            v.lock()
+            if v.conn:
+                v.conn.close()
+
+    def _index_poll(self):
+        if self._bg_stop.is_set() or not self.winfo_exists():
+            return
+        try:
+            result = self._index_out.get_nowait()
+        except queue.Empty:
+            self.after(VERIFY_STEP_MS, self._index_poll)
+            return
+        if isinstance(result, Exception):
+            self._index_failed = True
+            self.refresh()
+            messagebox.showwarning("URL 색인", f"색인 생성 중 오류가 발생했습니다:\n{result}")
+            return
+        self.vault.install_url_index(*result)
+        if (self.url_var.get() or "").strip():
+            self.refresh()
+
+    # ----- 백그라운드 무결성 검사 -----
+    @staticmethod
+    def _verify_worker(db_path, key, stop, out):
+        """작업 스레드: 조금씩 나눠 검사하고 최종 결과를 out 큐에 넣음 (Tk 호출 금지).
+        단계마다 체크포인트를 남겨 잠금/종료로 끊겨도 다음 잠금 해제 때 이어서 검사"""
+        v = Vault(db_path)
+        v.key = key
+        ckpt = verify_state_path(db_path, "scan")
+        state = load_verify_state(ckpt)
+        pool = verify_pool()
+        try:
+            v.connect()
+            while not stop.is_set():
+                rep = v.verify(start_after=state["last_id"], limit=VERIFY_STEP_ROWS, pool=pool)
+                merge_verify_report(state, rep)
+                if rep["done"]:
+                    # 이전 세션에서 찾은 항목 중 그사이 지워지거나 격리된 것은 제외
+                    state["broken"] = [b for b in state["broken"]
+                                       if v.conn.execute("SELECT 1 FROM entries WHERE id=?;", (b["id"],)).fetchone()]
+                    ckpt.unlink(missing_ok=True)
+                    out.put({**state, "error": None})
+                    return
+                save_verify_state(ckpt, state)
+                stop.wait(VERIFY_STEP_MS / 1000)
+        except (sqlite3.DatabaseError, OSError) as e:
+            out.put({**state, "error": str(e)})
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            v.lock()
+            if v.conn:
+                v.conn.close()
+
+    def _verify_poll(self):
+        if self._bg_stop.is_set() or not self.winfo_exists():
+            return
+        try:
+            result = self._verify_out.get_nowait()
+        except queue.Empty:
+            self.after(VERIFY_STEP_MS, self._verify_poll)
+            return
+        if result["error"]:
+            messagebox.showwarning("무결성 검사", f"검사 중 오류가 발생했습니다:\n{result['error']}")
+        if result["integrity"] is not None and result["integrity"] != ["ok"]:
+            messagebox.showwarning("무결성 검사", "DB 손상이 감지되었습니다:\n" + "\n".join(result["integrity"][:5]))
+        broken = result["broken"]
+        if not broken:
+            return
+        names = "\n".join(f"• {b['display']} (id={b['id']})" for b in broken[:10])
+        if len(broken) > 10:
+            names += f"\n… 외 {len(broken) - 10}건"
+        if messagebox.askyesno("무결성 검사",
+                               f"복호화할 수 없는 항목 {len(broken)}건이 있습니다:\n{names}\n\n격리할까요?"):
+            self.vault.quarantine_entries([b["id"] for b in broken])
+            self.refresh()
+
     # ----- 정보 -----
     def _about(self):
         from .version import __app_name__, __version__, __copyright__
@@ -17,14 +17,14 @@ def json_prompt_defaults() -> dict:
     return {"username": "", "password": "", "url": "", "notes": ""}
 
 def resource_path(rel_path: str) -> str:
-    # PyInstaller 대응
-    base = getattr(sys, "_MEIPASS", None)
-    if base:
-        return str(Path(base) / rel_path)
-    return rel_path
+    # PyInstaller 대응 (개발 모드에서는 프로젝트 루트 기준이라 실행 위치와 무관)
+    base = getattr(sys, "_MEIPASS", None) or Path(__file__).resolve().parent.parent
+    return str(Path(base) / rel_path)
 
 AUTO_LOCK_MIN = 5           # 자동 잠금 분 (원하면 UI에서 바꾸게 확장 가능)
 CLIPBOARD_CLEAR_SEC = 20    # 복사 후 자동 삭제 초
+VERIFY_STEP_ROWS = 5000     # 백그라운드 무결성 검사: 한 번에 검사할 행 수
+VERIFY_STEP_MS = 200        # 백그라운드 무결성 검사: 단계 사이 쉬는 간격/결과 확인 주기(ms)
 
 def try_icon(root):
     # Windows .ico가 있으면 창 아이콘 지정
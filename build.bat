@@ -1,4 +1,4 @@
 @echo off
 REM 가상환경에서 실행 가정: python -m pip install pyinstaller
-pyinstaller --noconsole --onefile --name MyVault app/main.py --paths .
+pyinstaller --noconsole --onefile --name MyVault app/main.py --paths . --add-data "app/data/strength.dict;app/data" --add-data "app/data/public_suffix.dat;app/data"
 echo Build done. See .\dist\MyVault.exe
\ No newline at end of file
@@ -1,3 +1,5 @@
+import multiprocessing
 from app.main import run  # app/main.py 안의 진입함수 이름에 맞게
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    multiprocessing.freeze_support()   # PyInstaller exe에서 무결성 검사 워커 프로세스 실행용
+    run()
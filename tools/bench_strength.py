@@ -0,0 +1,105 @@
+# tools/bench_strength.py
+# 비밀번호 강도 추정 벤치마크.
+# 사용: python tools/bench_strength.py [--corpus 파일(한 줄에 하나)] [-n 개수]
+# 코퍼스를 주지 않으면 사전 단어 변형/키보드 패턴/날짜/PIN·전화번호 등 숫자열/생성기 출력으로 샘플을 만든다.
+# 숫자만 있는 입력은 날짜·l33t 후보가 많아 가장 느리므로 따로도 보고한다.
+import argparse, random, statistics, sys, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import strength
+from app.generator import generate, GenOptions
+
+def dict_words() -> list:
+    data = strength.DICT_PATH.read_bytes()[4 + 257 * 4:]
+    return [line.split(b"\t", 1)[0].decode("utf-8") for line in data.splitlines()]
+
+def synth_corpus(n: int, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    words = dict_words()
+    leet = str.maketrans("aeios", "43105")
+    walks = ["qwerty", "asdfgh", "zxcvbn", "1qaz2wsx", "qazwsx", "!QAZ@WSX", "poiuyt", "hjkl;'"]
+    digits = lambda k, alphabet="0123456789": "".join(rnd.choice(alphabet) for _ in range(k))
+    out = []
+    while len(out) < n:
+        kind = rnd.random()
+        w = rnd.choice(words)
+        if kind < 0.25:
+            pw = w
+        elif kind < 0.4:
+            pw = w.capitalize() + str(rnd.randint(0, 9999))
+        elif kind < 0.5:
+            pw = w.translate(leet) + rnd.choice("!@#$%")
+        elif kind < 0.57:
+            pw = rnd.choice(walks) + str(rnd.randint(0, 99))
+        elif kind < 0.65:
+            pw = w + f"{rnd.randint(1950, 2025)}{rnd.randint(1, 12):02d}{rnd.randint(1, 28):02d}"
+        elif kind < 0.73:
+            pw = w + rnd.choice(words) + rnd.choice(words)
+        elif kind < 0.77:
+            pw = digits(rnd.choice((4, 4, 6, 6, 8)))                          # PIN
+        elif kind < 0.81:
+            pw = "010" + rnd.choice(("", "-")).join((digits(4), digits(4)))     # 전화번호
+        elif kind < 0.85:
+            pw = digits(rnd.randint(8, 64))                                   # 무작위 숫자열
+        elif kind < 0.88:
+            pw = digits(rnd.randint(16, 64), rnd.choice(("12", "01", "123")))   # 몇 가지 숫자만 반복
+        elif kind < 0.9:
+            pw = (digits(rnd.randint(2, 6)) * 32)[:rnd.randint(16, 64)]         # 1231231… 같은 반복
+        else:
+            pw = generate(GenOptions(length=rnd.randint(8, 24)))
+        out.append(pw)
+    return out
+
+def report(title: str, times: list):
+    times.sort()
+    us = lambda x: f"{x * 1e6:.0f} us"
+    print(f"{title}: 평균 {us(statistics.mean(times))}, p50 {us(times[len(times) // 2])}, "
+          f"p99 {us(times[int(len(times) * 0.99)])}, 최대 {us(times[-1])}")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--corpus", type=Path, default=None)
+    ap.add_argument("-n", type=int, default=100_000)
+    args = ap.parse_args()
+
+    t = time.perf_counter()
+    strength.estimate("warmup")
+    print(f"첫 호출(사전 mmap 포함): {(time.perf_counter() - t) * 1e3:.2f} ms")
+
+    if args.corpus:
+        corpus = args.corpus.read_text(encoding="utf-8", errors="ignore").splitlines()[:args.n]
+    else:
+        corpus = synth_corpus(args.n)
+
+    times, digit_times = [], []
+    scores = [0] * 5
+    for pw in corpus:
+        t = time.perf_counter()
+        r = strength.estimate(pw)
+        times.append(time.perf_counter() - t)
+        if pw.replace("-", "").isdigit():
+            digit_times.append(times[-1])
+        scores[r.score] += 1
+    print(f"샘플 {len(times):,}개, 평균 길이 {statistics.mean(map(len, corpus)):.1f}")
+    report("한 번에 평가", times)
+    if digit_times:
+        report(f"  그중 숫자만({len(digit_times):,}개)", digit_times)
+    print("점수 분포:", " ".join(f"{s}:{c}" for s, c in enumerate(scores)))
+
+    # 입력 중: 한 글자씩 칠 때마다 평가 (UI와 같은 호출 패턴)
+    times, digit_times = [], []
+    for pw in corpus[:max(1, len(corpus) // 10)]:
+        for k in range(1, len(pw) + 1):
+            t = time.perf_counter()
+            strength.estimate(pw[:k])
+            times.append(time.perf_counter() - t)
+            if pw.replace("-", "").isdigit():
+                digit_times.append(times[-1])
+    report("입력 중(키 입력당)", times)
+    if digit_times:
+        report("  그중 숫자만", digit_times)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# tools/bench_url_index.py
+# URL 색인 생성/조회 벤치마크. 임시 금고에 항목 N개를 넣고 작업 스레드 쪽 색인 생성(read_url_index),
+# UI 스레드 쪽 넣기(install_url_index) 시간과 match_url 조회 시간을 잰다.
+# 사용: python tools/bench_url_index.py [-n 100000]
+import argparse, json, random, statistics, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.crypto import encrypt
+from app.domains import url_domain
+from app.store import Vault
+
+SUFFIXES = ["com", "net", "org", "co.kr", "kr", "co.uk", "com.au", "github.io", "jp", "de"]
+SUBS = ["", "www.", "login.", "accounts.", "mail.", "m."]
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=100_000)
+    args = ap.parse_args()
+    rnd = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Vault(Path(tmp) / "bench.db")
+        vault.connect()
+        vault.init_db_if_needed()
+        vault.create_master("bench", kdf_iter=1_000)
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        urls, rows = [], []
+        for i in range(args.n):
+            url = f"https://{rnd.choice(SUBS)}site{rnd.randrange(args.n // 3)}.{rnd.choice(SUFFIXES)}/login"
+            display = f"site {i}"
+            fields = {"username": f"user{i}", "password": "x" * 16, "url": url, "notes": ""}
+            blob = encrypt(vault.key, json.dumps(fields).encode("utf-8"), aad=display.encode("utf-8"))
+            urls.append(url)
+            rows.append((display, blob, now, now))
+        vault.conn.executemany("INSERT INTO entries(display, data, created_at, updated_at) VALUES(?,?,?,?)", rows)
+        vault.conn.commit()
+        vault.lock()
+
+        t = time.perf_counter()
+        url_domain("warmup.example.com")
+        print(f"공개 접미사 트라이 로딩: {(time.perf_counter() - t) * 1e3:.1f} ms")
+
+        vault.unlock("bench")
+        assert vault.match_url(urls[0]) is None     # 색인 전에는 만들지 않고 None
+        # UI처럼 별도 연결의 Vault에서 생성 (실제로는 작업 스레드)
+        worker = Vault(vault.db_path)
+        worker.connect()
+        worker.key = vault.key
+        t = time.perf_counter()
+        built = worker.read_url_index()
+        build = time.perf_counter() - t
+        worker.lock()
+        worker.conn.close()
+        t = time.perf_counter()
+        vault.install_url_index(*built)
+        install = time.perf_counter() - t
+        print(f"항목 {args.n:,}개: 색인 생성(작업 스레드) {build * 1e3:.0f} ms, "
+              f"넣기(UI 스레드) {install * 1e6:.0f} us, 도메인 {len(vault._url_index):,}개")
+
+        queries = [rnd.choice(urls).replace("https://", "https://x.") for _ in range(10_000)]
+        for title, fn in (("도메인 색인 조회", lambda u: vault._url_index.get(url_domain(u))),
+                          ("match_url(행 조회 포함)", vault.match_url)):
+            times = []
+            for u in queries:
+                t = time.perf_counter()
+                fn(u)
+                times.append(time.perf_counter() - t)
+            times.sort()
+            print(f"{title}: 평균 {statistics.mean(times) * 1e6:.1f} us, "
+                  f"p99 {times[int(len(times) * 0.99)] * 1e6:.1f} us")
+        vault.conn.close()
+
+if __name__ == "__main__":
+    main()
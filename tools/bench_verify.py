@@ -0,0 +1,50 @@
+# tools/bench_verify.py
+# 무결성 검사(Vault.verify) 벤치마크. 임시 금고에 항목 N개를 넣고 전체 검사 시간을 잰다.
+# 워커 수별로 돌려 프로세스 병렬화 효과를 비교한다. (CPU 코어 수만큼까지만 빨라짐)
+# 사용: python tools/bench_verify.py [-n 200000] [--workers 1,4,8]
+import argparse, json, os, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.crypto import encrypt
+from app.store import Vault, VERIFY_WORKERS
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("-n", type=int, default=200_000)
+    ap.add_argument("--workers", default=",".join(str(w) for w in sorted({1, VERIFY_WORKERS})),
+                    help="쉼표로 구분한 워커 프로세스 수 목록")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vault = Vault(Path(tmp) / "bench.db")
+        vault.connect()
+        vault.init_db_if_needed()
+        vault.create_master("bench", kdf_iter=1_000)
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        for i in range(args.n):
+            display = f"site {i}"
+            fields = {"username": f"user{i}", "password": "x" * 16, "url": f"https://site{i}.com/login", "notes": ""}
+            blob = encrypt(vault.key, json.dumps(fields).encode("utf-8"), aad=display.encode("utf-8"))
+            rows.append((display, blob, now, now))
+        vault.conn.executemany("INSERT INTO entries(display, data, created_at, updated_at) VALUES(?,?,?,?)", rows)
+        vault.conn.commit()
+
+        t = time.perf_counter()
+        vault.conn.execute("PRAGMA integrity_check;").fetchall()
+        integrity = time.perf_counter() - t
+
+        print(f"CPU {os.cpu_count()}개, 항목 {args.n:,}개, integrity_check {integrity:.2f} s")
+        for workers in (int(w) for w in args.workers.split(",")):
+            t = time.perf_counter()
+            rep = vault.verify(workers=workers)     # 워커 프로세스 시작 비용 포함
+            total = time.perf_counter() - t
+            per_row = (total - integrity) / args.n
+            print(f"워커 {workers}개: 전체 {total:.2f} s, 행당 {per_row * 1e6:.1f} us, 손상 {len(rep['broken'])}건, "
+                  f"100만 개 추정 {integrity * 1_000_000 / args.n + per_row * 1_000_000:.1f} s")
+        vault.conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# tools/build_psl.py
+# 공개 접미사 목록(Public Suffix List, MPL 2.0)에서 주석을 걷어내 app/data/public_suffix.dat 생성.
+# 원본: https://publicsuffix.org/list/public_suffix_list.dat
+# 사용: python tools/build_psl.py public_suffix_list.dat [--out PATH]
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+HEADER = (
+    "// Public Suffix List (https://publicsuffix.org/), rules only.\n"
+    "// This Source Code Form is subject to the terms of the Mozilla Public\n"
+    "// License, v. 2.0. If a copy of the MPL was not distributed with this\n"
+    "// file, You can obtain one at https://mozilla.org/MPL/2.0/.\n"
+)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("src", type=Path)
+    ap.add_argument("--out", type=Path, default=ROOT / "app" / "data" / "public_suffix.dat")
+    args = ap.parse_args()
+    rules, version = [], ""
+    for line in args.src.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line.startswith("// VERSION:"):
+            version = line + "\n"
+        if line and not line.startswith("//"):
+            rules.append(line.split()[0])
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(HEADER + version + "\n".join(rules) + "\n", encoding="utf-8")
+    print(f"{args.out} ({len(rules):,} rules)")
+
+if __name__ == "__main__":
+    main()
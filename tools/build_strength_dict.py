@@ -0,0 +1,54 @@
+# tools/build_strength_dict.py
+# 비밀번호 강도 추정용 사전(app/data/strength.dict) 생성 스크립트.
+# 빈도 목록은 zxcvbn(MIT) 패키지에서 가져온다: pip install zxcvbn
+# 사용: python tools/build_strength_dict.py [--out PATH]
+#
+# 파일 형식
+#   [4B magic "PWD1"]
+#   [257 x uint32 LE] 첫 바이트 값 b로 시작하는 줄들의 시작 오프셋(257번째는 파일 끝)
+#   ["word\trank\n" ...] word(UTF-8 바이트) 기준 정렬, rank는 여러 목록 중 최소 순위
+import argparse, struct
+from pathlib import Path
+
+MAGIC = b"PWD1"
+ROOT = Path(__file__).resolve().parent.parent
+
+def collect() -> dict:
+    from zxcvbn.frequency_lists import FREQUENCY_LISTS
+    ranks = {}
+    for words in FREQUENCY_LISTS.values():
+        for rank, w in enumerate(words, 1):
+            w = w.strip().lower()
+            if not w or "\t" in w or "\n" in w:
+                continue
+            key = w.encode("utf-8")
+            if rank < ranks.get(key, rank + 1):
+                ranks[key] = rank
+    return ranks
+
+def build(ranks: dict) -> bytes:
+    header_len = len(MAGIC) + 257 * 4
+    body = bytearray()
+    index = [None] * 257
+    for key in sorted(ranks):
+        if index[key[0]] is None:
+            index[key[0]] = header_len + len(body)
+        body += key + b"\t" + str(ranks[key]).encode("ascii") + b"\n"
+    index[256] = header_len + len(body)
+    # 해당 바이트로 시작하는 단어가 없으면 다음 구간 시작과 같게 채움(빈 구간)
+    for b in range(255, -1, -1):
+        if index[b] is None:
+            index[b] = index[b + 1]
+    return MAGIC + struct.pack("<257I", *index) + bytes(body)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", type=Path, default=ROOT / "app" / "data" / "strength.dict")
+    args = ap.parse_args()
+    data = build(collect())
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_bytes(data)
+    print(f"{args.out} ({len(data):,} bytes)")
+
+if __name__ == "__main__":
+    main()